@@ -5,7 +5,6 @@ from ..reference.vocabulary import Vocabulary
 from ..reference.summary import Summary
 from ..reference.corpus import Corpus
 from .paradigms import Paradigms
-import random
 
 # TODO: Accentuation, suprasegmentals
 
@@ -72,7 +71,7 @@ import random
 # - see tasks within other class files
 
 class Language:
-    def __init__(self, name="", display_name="", boundary_symbol="#", source_symbol="_", affix_symbol="-", spacing_symbol=" "):
+    def __init__(self, name="", display_name="", boundary_symbol="#", source_symbol="_", affix_symbol="-", spacing_symbol=" ", rng=None):
         self.name = name
         self.display_name = display_name
         # ipa (sound symbols) and features
@@ -82,7 +81,7 @@ class Language:
         # for building and applying sentences
         self.sentences = Sentences(self.grammar)
         # phonemes and syllables atop phonetics
-        self.phonology = Phonology(self.phonetics)
+        self.phonology = Phonology(self.phonetics, rng=rng)
         # words with ipa, morphology, definition
         self.vocabulary = Vocabulary()
         # grammar storage and display
@@ -126,7 +125,7 @@ class Language:
         Intended for generating words with length number of syllables."""
         # choose a random number of syllables if no syllable count supplied
         if not length:
-            length = random.randint(self.syllables_min, self.syllables_max)
+            length = self.phonology.get_random().randint(self.syllables_min, self.syllables_max)
         # verify that syllable count is a whole number
         if not isinstance(length, int):
             print(f"Language failed to generate word - invalid number of syllables {length}")
@@ -181,9 +180,13 @@ class Language:
             'mid': mid,
             'post': post,
         }
+        requested_pieces = [k for k, v in pieces.items() if v]
         pieces = {
-            k: self.phonology.build_word(length)['sound']
-            for k, v in pieces.items() if v
+            k: word['sound']
+            for k, word in zip(
+                requested_pieces,
+                self.phonology.build_words(len(requested_pieces), length) or []
+            )
         }
 
         # create the exponent
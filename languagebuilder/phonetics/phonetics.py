@@ -1,4 +1,5 @@
 import random
+import sys
 
 # TODO: move to documentation - discusses components across a Language
 # (features <> ipa < Phonetics | Phonology > phoneme <> letter)
@@ -18,11 +19,28 @@ import random
 #   - search for input matches then change specific features
 #       - this means storing strings of features for each word, or phon symbs
 
+# shared immutable featuresets so symbols with the same features store one set
+_FEATURE_SET_POOL = {}
+
+def intern_features(features):
+    """Return the pooled frozenset holding exactly these features"""
+    key = tuple(sorted(features))
+    return _FEATURE_SET_POOL.setdefault(key, frozenset(key))
+
 # features to and from phonetic symbols
 class Phonetics:
     def __init__(self):
         self.features = {}  # map feature:{ipa}
         self.ipa = {}       # map ipa:{features}
+        self.symbols_by_features = {}   # map {features}:{ipa} for exact lookups
+        self.changes = 0    # count of map updates for invalidating caches
+
+    def __setstate__(self, state):
+        """Restore pickled maps, sharing pooled featuresets again"""
+        self.__dict__.update(state)
+        self.symbols_by_features = {}
+        for symbol, features in self.ipa.items():
+            self.set_symbol_features(symbol, features)
 
     def has_ipa(self, symbol):
         """Check if the symbol exists in the ipa map"""
@@ -44,10 +62,11 @@ class Phonetics:
             return
 
         # filter down to list of recognized phonetic features
-        parsed_features = list(filter(
+        # interned to match stored feature strings by identity
+        parsed_features = list(map(sys.intern, filter(
             lambda x: self.has_feature(x.lower().strip()),
             features_input
-        ))
+        )))
         return parsed_features
 
     def map_by_features(self):
@@ -72,6 +91,13 @@ class Phonetics:
         if not features:
             return []
 
+        # look up exact matches directly by their featureset
+        if exact:
+            return [
+                symbol for symbol in self.symbols_by_features.get(frozenset(features), ())
+                if not filter_phonemes or symbol in filter_phonemes
+            ]
+
         # optionally restrict phonetic symbols searched
         if filter_phonemes:
             phonetic_symbols = list(filter(
@@ -84,13 +110,8 @@ class Phonetics:
         # find symbols matching requested features to stored features
         found_symbols = set()
         for symbol in phonetic_symbols:
-            # store exact or subset match
-            match_features = self.ipa[symbol]
-            # add exact match if all symbol features are in requested
-            is_exact = exact and set(features) == match_features
             # add partial match if all requested features are in symbol
-            is_partial = not exact and match_features.issuperset(features)
-            if is_exact or is_partial:
+            if self.ipa[symbol].issuperset(features):
                 found_symbols.add(symbol)
         
         return list(found_symbols)
@@ -124,23 +145,48 @@ class Phonetics:
         if not isinstance(symbol, str):
             print(f"Features add_entry failed to add invalid symbol {symbol}")
             return
+        # intern symbol and feature strings so later comparisons short-circuit
+        symbol = sys.intern(symbol)
         # add each feature to both symbols and features maps
+        symbol_features = set(self.ipa.get(symbol, ()))
         for feature in features:
             # check that the feature is valid
             if not isinstance(feature, str):
                 print(f"Features add_entry skipped invalid feature {feature}")
                 continue
+            feature = sys.intern(feature)
             # add features and symbols to their sets
             self.features.setdefault(feature, set()).add(symbol)
-            self.ipa.setdefault(symbol, set()).add(feature)
+            symbol_features.add(feature)
+        self.set_symbol_features(symbol, symbol_features)
+        self.changes += 1
         return {symbol: self.ipa[symbol]}
 
+    def set_symbol_features(self, symbol, features):
+        """Store a symbol's features as a shared featureset and index the symbol
+        under that featureset"""
+        self.unindex_symbol(symbol)
+        featureset = intern_features(features)
+        self.ipa[symbol] = featureset
+        self.symbols_by_features.setdefault(featureset, set()).add(symbol)
+        return featureset
+
+    def unindex_symbol(self, symbol):
+        """Drop a symbol from the symbols by features index"""
+        featureset = self.ipa.get(symbol)
+        if featureset is None:
+            return
+        indexed_symbols = self.symbols_by_features.get(featureset, set())
+        indexed_symbols.discard(symbol)
+        if not indexed_symbols:
+            self.symbols_by_features.pop(featureset, None)
+
     def update_symbol(self, symbol, new_symbol):
         """Update a symbol in ipa and features maps"""
         if not self.has_ipa(symbol):
             return
         features = self.ipa[symbol]
-        self.ipa[new_symbol] = features
+        self.set_symbol_features(new_symbol, features)
         self.remove_symbol(
             symbol,
             feature_callback=lambda f: self.features[f].add(new_symbol)
@@ -152,10 +198,12 @@ class Phonetics:
         if not self.has_ipa(symbol):
             return
         features = list(self.ipa[symbol])
+        self.unindex_symbol(symbol)
         self.ipa.pop(symbol)
         for feature in features:
             self.features[feature].remove(symbol)
             feature_callback and feature_callback(feature)
+        self.changes += 1
         return features
 
     def update_feature(self, feature, new_feature):
@@ -170,7 +218,7 @@ class Phonetics:
         self.remove_feature(
             feature,
             # add the new feature to all symbols that had the old one
-            ipa_callback=lambda s: self.ipa[s].add(new_feature)
+            ipa_callback=lambda s: self.set_symbol_features(s, self.ipa[s] | {new_feature})
         )
         # return the updated feature name and data
         return {new_feature: self.features[new_feature]}
@@ -184,8 +232,9 @@ class Phonetics:
         symbols = list(self.features.pop(feature))
         # remove the feature from symbols
         for symbol in symbols:
-            self.ipa[symbol].remove(feature)
+            self.set_symbol_features(symbol, self.ipa[symbol] - {feature})
             ipa_callback and ipa_callback(symbol)
+        self.changes += 1
         # send back the deleted data
         return {feature: symbols}
 
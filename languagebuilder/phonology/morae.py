@@ -14,6 +14,9 @@ class Morae:
     def __init__(self, phonology):
         self.phonology = phonology
         self.morae = {}         # map moraic ids to features and beat count data
+        self.changes = 0        # count of added or removed morae for invalidating caches
+        self.patterns = []      # cached moraic featuresets and beats used for counting
+        self.patterns_changes = None
     
     def get(self, moraic_id=None):
         """Return the moraic details stored under the given id key, or all items
@@ -59,11 +62,39 @@ class Morae:
             'features': moraic_list,    # list of features lists
             'beats': beats              # beat count
         }
+        self.changes += 1
         return moraic_id
 
+    def add_many(self, morae, overwrite=False):
+        """Store a list of moraic structures and their beat counts
+        
+        Args:
+            morae (list): List of (sounds_or_features, beats) pairs.
+            overwrite (bool): replace any existing morae with the same structure.
+
+        Returns:
+            A list of string ids for the morae that were added.
+        """
+        if not isinstance(morae, (list, tuple)):
+            print(f"Morae add_many failed - expected a list of morae not {morae}")
+            return
+        moraic_ids = []
+        for mora in morae:
+            # NOTE: not all-or-nothing add, log skipped morae to console
+            if not isinstance(mora, (list, tuple)) or len(mora) != 2:
+                print(f"Morae add_many skipped invalid mora and beats pair {mora}")
+                continue
+            sounds_or_features, beats = mora
+            moraic_id = self.add(sounds_or_features, beats=beats, overwrite=overwrite)
+            # keep references to successfully added morae
+            moraic_id and moraic_ids.append(moraic_id)
+        return moraic_ids
+
     def remove(self, moraic_id):
         """Delete one item from the morae map"""
-        return self.morae.pop(moraic_id)
+        removed_mora = self.morae.pop(moraic_id)
+        self.changes += 1
+        return removed_mora
 
     def find(self, mora=None, beats=None, vet_mora=True, first_only=False):
         """Return a list of ids for morae that share the beatcount or moraic structure"""
@@ -111,25 +142,27 @@ class Morae:
     def vet_mora(self, sounds_or_features):
         """Turn a list of sounds or features into a list of lists of features
         to be identified as a mora"""
+        phonetics = self.phonology.phonetics
+        syllable_characters = self.phonology.syllables.syllable_characters
         vetted_mora = []
         for features in sounds_or_features:
             # attempt to read as a single sound
-            if self.phonology.phonetics.has_ipa(features):
-                vetted_mora.append(self.phonology.phonetics.get_features(features))
+            if phonetics.has_ipa(features):
+                vetted_mora.append(phonetics.get_features(features))
+                continue
             # attempt to read as a special feature character
-            elif isinstance(features, str) and features in self.phonology.syllables.syllable_characters:
-                feature = self.phonology.syllables.syllable_characters[features]
-                vetted_feature = feature if self.phonology.phonetics.has_feature(feature) else None
-                if vetted_feature:
-                    vetted_mora.append([vetted_feature])
+            if isinstance(features, str) and features in syllable_characters:
+                feature = syllable_characters[features]
+                if phonetics.has_feature(feature):
+                    vetted_mora.append([feature])
+                continue
             # attempt to read as a feature string or features list
-            elif self.phonology.phonetics.parse_features(features):
-                vetted_features = self.phonology.phonetics.parse_features(features)
-                vetted_mora.append(vetted_features)
+            vetted_features = phonetics.parse_features(features)
             # back out if sound or features not found in this position
-            else:
+            if not vetted_features:
                 print(f"Morae failed to vet unrecognized features in {sounds_or_features}")
                 return
+            vetted_mora.append(vetted_features)
         return vetted_mora
 
     # TODO: handle conflicts/overlaps, like if V counts as 1 but VC is 2
@@ -137,24 +170,35 @@ class Morae:
     def is_superlist(self, list_of_setlists, compared_setlist):
         """Check that any setlists in a list of list of sets are supersets of the
         compared setlist's sets, in order"""
-        matches = list(filter(
-            lambda x: x,
-            [
-                set(l[i]).issuperset(set(compared_setlist[i]))
-                if i < len(compared_setlist) else False
-                for l in list_of_setlists
-                for i in range(len(l))
+        return any(
+            frozenset(l[i]).issuperset(compared_setlist[i])
+            for l in list_of_setlists
+            for i in range(min(len(l), len(compared_setlist)))
+        )
+
+    def moraic_patterns(self):
+        """Return stored morae as (tuple of featuresets, beats) pairs for counting,
+        rebuilding them only after morae have been added or removed"""
+        if self.patterns_changes != self.changes:
+            self.patterns = [
+                (
+                    tuple(frozenset(features) for features in moraic_details['features']),
+                    moraic_details['beats']
+                )
+                for moraic_details in self.morae.values()
             ]
-        ))
-        return any(matches)
+            self.patterns_changes = self.changes
+        return self.patterns
 
     def count(self, sounds_sample):
         """Count the number of beats in a sound sample based on stored morae"""
-        # convert sounds into a list of per-sound feature collections
+        # convert sounds into a list of per-sound featuresets
+        features_by_ipa = self.phonology.phonetics.map_by_ipa()
         sample_features = [
-            self.phonology.phonetics.get_features(sound)
+            features_by_ipa.get(sound, frozenset())
             for sound in sounds_sample
         ]
+        moraic_patterns = self.moraic_patterns()
         
         # keep track of moraic windows from sample and matched moraic beats
         tracked_morae = []
@@ -167,13 +211,12 @@ class Morae:
             tracked_morae += [[]]
             [track.append(features) for track in tracked_morae]
             # traverse morae looking for matches
-            for compared_details in self.morae.values():
-                compared_features = compared_details['features']
+            for compared_features, beats in moraic_patterns:
                 # compare tossable tracks for full matchups
                 # (any sample moraic window matches any existing moraic entry)
                 if self.is_superlist(tracked_morae, compared_features):
                     # count beats and reset tracking
-                    count += compared_details['beats']
+                    count += beats
                     tracked_morae.clear()
                     break
         
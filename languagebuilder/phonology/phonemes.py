@@ -2,6 +2,7 @@
 class Phonemes():
     def __init__(self):
         self.phonemes = {}
+        self.changes = 0    # count of added, updated or removed phonemes for invalidating caches
 
     def has(self, ipa):
         return ipa in self.phonemes
@@ -37,6 +38,7 @@ class Phonemes():
 
         # create entry
         self.phonemes[ipa] = phoneme
+        self.changes += 1
         return phoneme
     
     # TODO: ability to manage (crud) individual letters
@@ -50,6 +52,7 @@ class Phonemes():
         # update individual properties in the phoneme
         phoneme['letters'] = set(letters) if letters else phoneme['letters']
         phoneme['weight'] = weight if weight else phoneme['weight']
+        self.changes += 1
         # also update the ipa and return the new object
         if new_ipa:
             return self.update_ipa(ipa, new_ipa)
@@ -68,10 +71,12 @@ class Phonemes():
         # modify and store the phoneme object
         phoneme['ipa'] = new_ipa
         self.phonemes[new_ipa] = phoneme
+        self.changes += 1
         return phoneme
 
     def remove(self, ipa):
         """Delete phoneme associated with one symbol from the phonemes"""
+        self.changes += 1
         return self.phonemes.pop(ipa, None)
 
     def symbols(self):
@@ -7,6 +7,7 @@ from .ruletracker import RuleTracker
 from .suprasegmentals import Suprasegmentals
 # for sound, letter and syllable generation
 import random
+from itertools import accumulate
 
 # TODO: accentuation/suprasegmentals here and in Phonetics 
 
@@ -16,9 +17,11 @@ import random
 #   - inject classes here
 
 class Phonology:
-    def __init__(self, phonetics):
+    def __init__(self, phonetics, rng=None):
         # phonetic mapping between ipa and features
         self.phonetics = phonetics
+        # optional random.Random instance for reproducible word building
+        self.rng = rng
         # collections for this inventory
         self.phonemes = Phonemes()
 
@@ -34,10 +37,80 @@ class Phonology:
         self.source_symbol = "_"
         self.boundary_symbol = "#"
 
+        # inventory symbols per featureset used when building words
+        self.inventory_symbols = {}
+        self.inventory_symbols_changes = None
+        # cumulative phoneme weights for choosing among those symbols
+        self.inventory_weights = {}
+        # symbols and weights for each sound slot per syllable structure
+        self.syllable_pools = {}
+
+        # letter options per phoneme used when spelling, kept until phonemes change
+        self.phoneme_letters = {}
+        self.phoneme_letters_changes = None
+
+        # symbols after each feature change, kept until phonetics change
+        self.changed_symbols = {}
+        self.changed_symbols_changes = None
+
+    def get_random(self):
+        """Read the source of random choices for building words, either the
+        supplied rng or the random module itself"""
+        return self.rng if self.rng is not None else random
+
     # inventory now managed through Phonemes (letters <> ipa) and Features (features <> ipa) instead of previous Inventory class
     def inventory(self):
         """Read all phonetic symbols stored in this inventory"""
         return self.phonemes.symbols()
+
+    def _refresh_inventory_lookups(self):
+        """Forget found symbols, weights and pools once the phonetics or inventory changes"""
+        changes = (self.phonetics.changes, self.phonemes.changes)
+        if self.inventory_symbols_changes != changes:
+            self.inventory_symbols.clear()
+            self.inventory_weights.clear()
+            self.syllable_pools.clear()
+            self.inventory_symbols_changes = changes
+
+    def get_inventory_ipa(self, features):
+        """Find inventory symbols having all of the features. Lookups are kept
+        until the phonetics or phonemes change."""
+        self._refresh_inventory_lookups()
+
+        # search phonetics for symbols the first time features are requested
+        # (sorted so seeded draws do not depend on set ordering)
+        features_key = tuple(features)
+        if features_key not in self.inventory_symbols:
+            self.inventory_symbols[features_key] = sorted(self.phonetics.get_ipa(
+                features,
+                filter_phonemes=self.inventory()
+            ))
+        return self.inventory_symbols[features_key]
+
+    def get_inventory_weights(self, features):
+        """Find cumulative weights for choosing between inventory symbols having
+        all of the features. Sounds added without a weight count as weight 1."""
+        symbols = self.get_inventory_ipa(features)
+        features_key = tuple(features)
+        if features_key not in self.inventory_weights:
+            self.inventory_weights[features_key] = list(accumulate(
+                self.phonemes.get_weight(symbol) or 1
+                for symbol in symbols
+            ))
+        return self.inventory_weights[features_key]
+
+    def get_syllable_pools(self, syllable_structure):
+        """Resolve each featureset in a syllable structure to a tuple of its inventory
+        symbols and cumulative weights, leaving out featuresets no inventory sound has"""
+        self._refresh_inventory_lookups()
+        structure_key = tuple(tuple(features) for features in syllable_structure)
+        if structure_key not in self.syllable_pools:
+            self.syllable_pools[structure_key] = tuple(
+                (tuple(self.get_inventory_ipa(features)), self.get_inventory_weights(features))
+                for features in syllable_structure
+                if self.get_inventory_ipa(features)
+            )
+        return self.syllable_pools[structure_key]
     
     # Rules
     def add_rule(self, source, target, environment_structure):
@@ -52,8 +125,6 @@ class Phonology:
         # filter features sequences
         vetted_source = self.phonetics.parse_features(source)
         vetted_target = self.phonetics.parse_features(target)
-        print("Adding Rule - vetted source: ", vetted_source)
-        print("Adding Rule - vetted target: ", vetted_target)
 
         if not (vetted_source and vetted_target):
             print(f"Phonology add_rule failed - invalid features lists for source {vetted_source} or target {vetted_target}")
@@ -102,15 +173,14 @@ class Phonology:
     # IPA methods checking both phonology and phonetics
     def has_sound(self, ipa):
         """Check that fully-featured sound exists both in phonemes and phonetics"""
-        if self.phonetics.has_ipa(ipa) and self.phonemes.has(ipa):
-            return True
-        return False
+        return self.phonemes.has(ipa) and self.phonetics.has_ipa(ipa)
     #
     def get_sound_features(self, ipa):
+        """Read the shared immutable featureset for one sound"""
         if not self.has_sound(ipa):
             print(f"Phonology get_sound_features failed - unknown symbol {ipa}")
             return
-        return self.phonetics.get_features(ipa)
+        return self.phonetics.map_by_ipa()[ipa]
     #
     def get_sound_letters(self, ipa):
         if not self.has_sound(ipa):
@@ -126,15 +196,23 @@ class Phonology:
     #
     # TODO: add weights for letter choice
     #   - current weight intended for distributing phon freq
-    def add_sound(self, ipa, letters=[], weight=0):
+    def add_sound(self, ipa, letters=(), weight=0):
         """Add one phonetic symbol, associated letters and optional weight
-        to the inventory and """
-        if not self.phonetics.has_ipa(ipa) or not all(isinstance(l, str) for l in letters) or len(letters) < 1:
+        to the inventory, merging letters into an already added symbol"""
+        # expect a known symbol and a nonempty collection of letter strings
+        valid_letters = isinstance(letters, (list, tuple, set)) and letters and all(
+            isinstance(letter, str) for letter in letters
+        )
+        if not valid_letters or not self.phonetics.has_ipa(ipa):
             raise NameError("Phonology add_sound failed - invalid phonetic symbol or letters")
-        # check for modification to existing phoneme
-        if self.phonemes.has(ipa):
-            print(f"Phonology add_sound failed - phoneme {ipa} already exists")
-            return
+        # merge letters and weight into the one existing phoneme for this symbol
+        existing_phoneme = self.phonemes.get(ipa)
+        if existing_phoneme:
+            return self.phonemes.update(
+                ipa,
+                letters=existing_phoneme['letters'].union(letters),
+                weight=max(weight, existing_phoneme['weight'])
+            )
         # store phoneme data
         return self.phonemes.add(ipa, letters, weight)
     #
@@ -177,23 +255,38 @@ class Phonology:
         returns:
             => (str)    a single ipa symbol after this sound change
         """
-        # fetch symbols matching the symbol feature
-        symbol_features = self.phonetics.get_features(ipa_symbol)
-        new_symbol_features = set(target_features)
+        # forget changed symbols once the phonetics changes
+        if self.changed_symbols_changes != self.phonetics.changes:
+            self.changed_symbols.clear()
+            self.changed_symbols_changes = self.phonetics.changes
+
+        # reuse the result of the same change to the same symbol
+        source_features = frozenset(source_features)
+        target_features = frozenset(target_features)
+        change_key = (source_features, target_features, ipa_symbol, exact)
+        if change_key not in self.changed_symbols:
+            self.changed_symbols[change_key] = self.find_changed_symbol(
+                source_features,
+                target_features,
+                ipa_symbol,
+                exact
+            )
+        return self.changed_symbols[change_key]
+
+    def find_changed_symbol(self, source_features, target_features, ipa_symbol, exact):
+        """Search phonetics for the symbol a change_symbol call resolves to"""
+        # fetch the featureset for the symbol
+        symbol_features = self.phonetics.map_by_ipa().get(ipa_symbol)
+        if symbol_features is None:
+            print(f"Phonology change_symbol failed - unknown symbol {ipa_symbol}")
+            return
         
-        # log start of change attempt
-        print(f"Currently attempting to turn {symbol_features} into a {target_features}")
-        
-        # merge target features into symbol features where rule changes from source->target
-        for feature in symbol_features:
-            if feature in source_features and feature not in target_features:
-                pass
-            else:
-                new_symbol_features.add(feature)
+        # swap source features in the symbol for target features
+        new_symbol_features = (symbol_features - source_features) | target_features
         
         # find phonetic symbols with these features
         # from all possible symbols not just current inventory
-        new_symbols = self.phonetics.get_ipa(list(new_symbol_features), exact=exact)
+        new_symbols = self.phonetics.get_ipa(new_symbol_features, exact=exact)
 
         # no symbols match this new set of features
         if not new_symbols:
@@ -205,9 +298,6 @@ class Phonology:
         new_symbol = new_symbols[0]
 
         # TODO: decide how to select from symbols list (just zeroth? arbitrary?)
-        
-        # log change attempt success
-        print(f"Successfully changed '{ipa_symbol}' into '{new_symbol}'.")
 
         return new_symbol
 
@@ -289,9 +379,6 @@ class Phonology:
             symbol = ipa_sequence[word_index]
             sound_features = word_features[symbol]
 
-            # log this attempt to fit symbol into rule environment
-            print(f"Checking if rule starts applying at {sound_features}.\nRule: {self.rules.get_pretty(rule_id)}")
-
             # Rule Track: start tracking for full environment match at this word index
             rule_tracker.track(word_index)
 
@@ -325,8 +412,6 @@ class Phonology:
             )
             if not changed_ipa:
                 changed_ipa = ipa_to_change
-            print("source ipa: " + ipa_to_change)
-            print("updated ipa: " + changed_ipa)
 
             # store the changed sound
             new_ipa_sequence[index_to_change] = changed_ipa
@@ -338,7 +423,6 @@ class Phonology:
             raise ValueError(f"Changed word lacks expected start and end boundaries.")
 
         # send back the list of sequences with sounds changed
-        print(f"Finished applying rule to create new sequence: {new_ipa_sequence}")
         return new_ipa_sequence
 
     def apply_rules(self, ipa_sequence):
@@ -346,15 +430,12 @@ class Phonology:
         result of each rule application to the next rule as sorted in Rules.order"""
 
         # set up the word
-        print(f"\nApplying all rules to input ipa sequence {ipa_sequence}")
         new_ipa_sequence = [character for character in ipa_sequence]
 
         # traverse local rules map searching for and applying rule matches
         for rule_id in self.rules.get():
             new_ipa_sequence = self.apply_rule(new_ipa_sequence, rule_id)
 
-        print(f"Finished applying all rules to create new ipa sequence {new_ipa_sequence}\n")
-
         # return the changed sequence fed through all rules
         return new_ipa_sequence
 
@@ -368,6 +449,7 @@ class Phonology:
             spell_after_change (bool): whether to base the spelling on the changed sounds
             order_rules (bool): apply sound change rules in order or randomly
             as_string (bool): return the word as a string instead of a list of ipa symbols
+                (missing sounds, changes or spellings become empty strings)
             midpoint (int): number of syllables to the left of word split point
         return:
             map entry representing a built word following the phonology. map attributes:
@@ -376,51 +458,57 @@ class Phonology:
             'spelling' (list): string list containing spelling symbols derived from sounds
             'midpoint' (int): the split/infix point within the sound symbols
         """
-        # form a list of possible syllables to choose from
-        syllables = self.syllables.get()
+        # build a batch of one word
+        word_entries = self.build_words(
+            1,
+            length=length,
+            apply_rules=apply_rules,
+            spell_after_change=spell_after_change,
+            as_string=as_string,
+            midpoint=midpoint
+        )
+        return word_entries[0] if word_entries else None
+
+    def build_words(self, count, length=1, apply_rules=True, spell_after_change=False, as_string=False, midpoint=None):
+        """Form a list of words following the defined inventory and syllable structure,
+        choosing syllable structures for all of the words at once. Takes the same
+        options as build_word for each word built.
+
+        args:
+            count (int): number of words to build
+            length (int): number of syllables in each built word
+        return:
+            list of map entries as returned by build_word
+        """
+        syllables = self.syllables.get_structures()
         if not syllables:
-            print("Phonology build_word failed - no possible syllables found")
+            print("Phonology build_words failed - no possible syllables found")
             return
 
-        # choose random syllable structures to build shape of final word
-        syllable_structures = [
-            syllables[random.choice(list(syllables.keys()))]
-            for i in range(length)
+        # choose syllable structures for every word in one draw then split per word
+        syllable_structures = self.get_random().choices(syllables, k=count * length)
+        return [
+            self._assemble_word(
+                syllable_structures[i * length:(i + 1) * length],
+                apply_rules=apply_rules,
+                spell_after_change=spell_after_change,
+                as_string=as_string,
+                midpoint=midpoint
+            )
+            for i in range(count)
         ]
 
-        print(f"Choosing from syllable structures:\n{syllable_structures}")
-
-        # store sound (phonemes) forms of words being built
-        word_ipa = []
+    def _assemble_word(self, syllable_structures, apply_rules=True, spell_after_change=False, as_string=False, midpoint=None):
+        """Fill chosen syllable structures with inventory sounds and build the word entry"""
+        # choose sounds syllable by syllable then join them into the word
+        built_syllables = self._choose_sounds(syllable_structures)
+        word_ipa = [symbol for built_syllable in built_syllables for symbol in built_syllable]
 
-        # prepare to count number of sounds before midpoint syllable
+        # count up the number of sounds to the left of the midpoint
         if midpoint:
-            syllable_count = 0
-            midpoint_sound_count = 0
-
-        # TODO: choose ipa by frequency (commonness) using Phoneme 'weight'
-        for syllable_structure in syllable_structures:
-            built_syllable = []
-            for feature_set in syllable_structure:
-                # find all inventory ipa that have these features
-                symbols = self.phonetics.get_ipa(feature_set, filter_phonemes=self.inventory())
-                print("Choosing from the following symbols: ", symbols)
-                # TODO: you store Phoneme with associated letters so this should be easy
-                #   - inventory maps features to letters
-                #   - features maps them to sounds
-                #   - instead stick with features <> ipa <> letters
-                #   - use Features and Phoneme to accomplish (see features.py comment)
-                if symbols:
-                    # choose from ipa symbols that matched subset of features
-                    symbol = random.choice(symbols)
-                    # storage
-                    word_ipa.append(symbol)         # for word output
-                    built_syllable.append(symbol)   # for syllable-by-syllable callback
-            # count up the number of sounds to the left of the midpoint
-            if midpoint:
-                if syllable_count < midpoint:
-                    midpoint_sound_count += len(built_syllable) 
-                syllable_count += 1
+            midpoint_sound_count = sum(
+                len(built_syllable) for built_syllable in built_syllables[:midpoint]
+            )
 
         # TODO: affixation before sound changes
         #   - have Language method for building and applying sound change atop units
@@ -445,12 +533,45 @@ class Phonology:
         # NOTE: intended for custom output; language methods expect lists of strings!
         if as_string:
             return {
-                k: "".join(v) if isinstance(v, list) else v
+                k: v if k == 'midpoint' else "".join(v or [])
                 for k, v in word_entry.items()
             }
 
         return word_entry
 
+    def _choose_sounds(self, syllable_structures):
+        """Choose inventory sounds for each featureset in each syllable structure,
+        returning one list of sounds per syllable"""
+        # TODO: you store Phoneme with associated letters so this should be easy
+        #   - inventory maps features to letters
+        #   - features maps them to sounds
+        #   - instead stick with features <> ipa <> letters
+        #   - use Features and Phoneme to accomplish (see features.py comment)
+        # look up each chosen syllable's pools of symbols and weights
+        syllable_pools = [
+            self.get_syllable_pools(syllable_structure)
+            for syllable_structure in syllable_structures
+        ]
+        # count the sounds each pool of symbols supplies across the whole word
+        # (featuresets resolving to the same symbols share one pool)
+        pool_counts = {}
+        for pools in syllable_pools:
+            for symbols, cum_weights in pools:
+                pool_counts.setdefault(symbols, [cum_weights, 0])[1] += 1
+        # choose from ipa symbols that matched subset of features
+        # more often for sounds with a greater phoneme weight,
+        # drawing all of a pool's sounds for the word in one call
+        choices = self.get_random().choices
+        pool_draws = {
+            symbols: iter(choices(symbols, cum_weights=cum_weights, k=count))
+            for symbols, (cum_weights, count) in pool_counts.items()
+        }
+        # hand out drawn sounds to their slots in order
+        return [
+            [next(pool_draws[symbols]) for symbols, cum_weights in pools]
+            for pools in syllable_pools
+        ]
+
     # TODO: handle spelling rules and environments
     def spell(self, phonemes, fallback_phonemes=None):
         """Transform a list of sounds into a list of letters (including multigraphs)
@@ -474,8 +595,12 @@ class Phonology:
         # characters that can be passed through without spelling
         skippable_chars = ("")
 
-        print(f"These are the changed sounds to spell: {phonemes}")
-        print(f"These are the fallback sounds to spell: {fallback_phonemes}")
+        # forget letter options once the phonemes change
+        if self.phoneme_letters_changes != self.phonemes.changes:
+            self.phoneme_letters.clear()
+            self.phoneme_letters_changes = self.phonemes.changes
+        phoneme_letters = self.phoneme_letters
+        choice = self.get_random().choice
 
         # traverse choosing a letter for each sound
         for i, phoneme in enumerate(phonemes):
@@ -493,7 +618,9 @@ class Phonology:
             
             
             # choose a letter from possible representations
-            letter = random.choice(list(self.phonemes.get_letters(spelled_phoneme)))
+            if spelled_phoneme not in phoneme_letters:
+                phoneme_letters[spelled_phoneme] = sorted(self.phonemes.get_letters(spelled_phoneme))
+            letter = choice(phoneme_letters[spelled_phoneme])
             # store the letter to spell this sound
             letters.append(letter)
 
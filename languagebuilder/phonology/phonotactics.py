@@ -1,6 +1,5 @@
 from .hierarchy import Hierarchy
 from ..tools import redacc
-import random
 
 # NOTE: Phonotactics esp scale & dep build left-to-right. "Progressive" constraints are
 # unideally handled either during syllable definition, e.g. in specific syllable types,
@@ -150,7 +149,10 @@ class Phonotactics:
             syllable_shape['onset'] += [self.recommend(last_sound, current_features)]
 
         # shape nucleus
-        syllable_shape['nucleus'] = list(random.choice(self.nuclei))
+        # (sorted so seeded draws do not depend on set ordering)
+        syllable_shape['nucleus'] = list(self.phonology.get_random().choice(
+            sorted(self.nuclei, key=sorted)
+        ))
 
         # shape coda
         for current_features in syllable_pieces['coda']:
@@ -79,7 +79,6 @@ class RuleTracker():
             'success': False,
             'failure': False
         }
-        print(f"RuleTracker set up tracking starting at word index {word_index}")
         return track_id
 
     def untrack(self, track_id):
@@ -100,7 +99,6 @@ class RuleTracker():
         if not index or not source:
             print(f"RuleTracker set source failed - missing critical ipa index or source info")
             return
-        print(f"Found source match (_)! Storing {source}")
         self.tracks[track_id]['source'] = source
         self.tracks[track_id]['index'] = index
         self.tracks[track_id]['count'] += 1
@@ -118,7 +116,6 @@ class RuleTracker():
         """Mark a rule track as successful if it has a valid source sound and matched
         up to the length of the rule's environment. Return the track's success value."""
         if self.tracks[track_id]['count'] >= len(self.environment):
-            print(f"RuleTracker successfully tracked rule with environment: {self.environment}. Marked sound for change: {self.tracks[track_id]['source']} at word index {self.tracks[track_id]['index']}.")
             self.tracks[track_id]['success'] = True
         return self.tracks[track_id]['success']
 
@@ -160,7 +157,6 @@ class RuleTracker():
     
         # do not check track if track has finished
         if track['success'] or track['failure']:
-            print(f"RuleTracker match skipped {features} - track {track_id} has already {('succeeded', 'failed')[not track['success']]}.")
             return
         
         # Keep tracking if features match current slot, otherwise untrack
@@ -181,25 +177,15 @@ class RuleTracker():
 
     def check_source_match(self, track_id, features, index):
         """Determine if the sound fits in the source->target change slot in the environment"""
-        # fetch current track and environment
-        track = self.tracks[track_id]
-        environment_slot = self.environment[track['count']]
         # check if the evaluated sound has all of the rule source features
         if self.is_features_submatch(self.source_features, features):
             self.set_source_match(track_id, features, index)
-            print(f"RuleTracker successfully found a source sound with features {features}")
             # mark success if rule completely finished matching
             self.check_success(track_id)
             return True
         
         # sound is not a source features match for the slot
-        print(f"RuleTracker did not find a source match on {features}, even though environment up to this point matched.")
         self.tracks[track_id]['failure'] = True
-        
-        # log extra message when failure is owed to no environment slot match
-        if environment_slot != self.source_symbol:
-            print(f"RuleTracker expected a source slot symbol {self.source_symbol} at slot {environment_slot}")
-       
         return False
 
     # TODO: just pass track and sound, since track already knows environment
@@ -211,7 +197,6 @@ class RuleTracker():
         # read track and environment data
         track = self.tracks[track_id]
         environment_slot = self.environment[track['count']]
-        print(f"RuleTracker check_environment match trying to fit {features} to slot {environment_slot}")
         
         # failed environment match - prepare to reset this particular track
         if not self.is_features_submatch(environment_slot, features):
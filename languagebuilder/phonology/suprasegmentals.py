@@ -293,14 +293,20 @@ class Suprasegmentals:
         # is a list
         if not isinstance(word, (tuple, list)):
             return False
+        # sounds known to both the phonemes and the phonetics
+        phoneme_symbols = self.phonology.phonemes.get().keys()
+        phonetic_symbols = self.phonology.phonetics.map_by_ipa().keys()
         # is a list of syllable lists
         for syllable in word:
             if not isinstance(syllable, (tuple, list)):
                 return False
             # is a sound string
-            for sound in syllable:
-                if not isinstance(sound, str) or not self.phonology.has_sound(sound):
-                    return False
+            if not all(isinstance(sound, str) for sound in syllable):
+                return False
+            # every sound is known
+            sounds = set(syllable)
+            if not (phoneme_symbols >= sounds and phonetic_symbols >= sounds):
+                return False
         return True
 
     def map_diacritic(self, diacritic, symbol, modified_symbol, is_spelling=False):
@@ -1,12 +1,24 @@
 from .phonotactics import Phonotactics
 from uuid import uuid4
 from ..tools import redacc
-import random
+
+# split feature strings like "velar stop" shared across syllable parses
+_TOKEN_CACHE = {}
+
+def split_features(features_string):
+    """Split a space-separated features string into a tuple of features"""
+    if features_string not in _TOKEN_CACHE:
+        _TOKEN_CACHE[features_string] = tuple(features_string.split())
+    return _TOKEN_CACHE[features_string]
 
 class Syllables():
     def __init__(self, phonology):
         # map of syllable structures
         self.syllables = {}
+        self.changes = 0    # count of added, updated or removed syllables for invalidating caches
+        # tuple of stored structures to choose from, kept until syllables change
+        self.syllable_structures = ()
+        self.syllable_structures_changes = None
         # special syllable character abbreviations
         self.syllable_characters = {
             '_': "_",
@@ -17,6 +29,9 @@ class Syllables():
         }
         # reference phonology into which injected
         self.phonology = phonology
+        # parsed structures per raw string structure, reset on phonetics changes
+        self.structures = {}
+        self.structures_phonetics_changes = None
         # set up phonotactics subclass
         self.phonotactics = Phonotactics(phonology)
         
@@ -38,19 +53,27 @@ class Syllables():
         # return a single syllable entry
         return self.syllables.get(syllable_id)
 
+    def get_structures(self):
+        """Read all stored syllable structures as a tuple, rebuilt only after
+        syllables have been added, updated or removed"""
+        if self.syllable_structures_changes != self.changes:
+            self.syllable_structures = tuple(self.syllables.values())
+            self.syllable_structures_changes = self.changes
+        return self.syllable_structures
+
     # TODO: check how environment/rule formats readout
     def print_syllables(self):
         """Print out all syllables in a human-readable formatted string"""
-        syllable_text = ""
-        count = 0
-        for syllable in self.syllables.values():
-            count += 1
-            syllable_text += f"Syllable {count}: "
-            for syllable_item in syllable.get_structure():
-                for feature in syllable_item:
-                    syllable_text += f"{feature}, "
-            syllable_text = syllable_text[:-2]
-            syllable_text += "\n"
+        # collect one line per syllable and join them once
+        syllable_lines = [
+            f"Syllable {count}: " + ", ".join(
+                feature
+                for syllable_item in syllable
+                for feature in syllable_item
+            )
+            for count, syllable in enumerate(self.syllables.values(), start=1)
+        ]
+        syllable_text = "".join(f"{line}\n" for line in syllable_lines)
         print(syllable_text)
         return syllable_text
 
@@ -59,13 +82,35 @@ class Syllables():
         if not isinstance(raw_structure, (list, tuple, str)):
             print(f"Failed to structure syllable - expected list or string not {raw_structure}")
             return
-        
+
+        # cache parses of string templates like "CVC" which get restructured often
+        if not isinstance(raw_structure, str):
+            return self._parse_structure(raw_structure)
+
+        # forget parsed structures once features may have been added or removed
+        if self.structures_phonetics_changes != self.phonology.phonetics.changes:
+            self.structures.clear()
+            self.structures_phonetics_changes = self.phonology.phonetics.changes
+
+        # parse and store the structure the first time it is seen
+        if raw_structure not in self.structures:
+            structure = self._parse_structure(raw_structure)
+            if not structure:
+                return structure
+            self.structures[raw_structure] = structure
+
+        # copy the stored structure so callers can modify their own
+        return [list(item) for item in self.structures[raw_structure]]
+
+    def _parse_structure(self, raw_structure):
+        """Build up a structure list from a raw string or list syllable"""
         # treat string as list of special syllable characters
         #
         # TODO: parse string into list containing features or syllable characters
         syllable_items = list(raw_structure) if isinstance(raw_structure, str) else raw_structure
 
         structure = []
+        has_feature = self.phonology.phonetics.has_feature
 
         # TODO: use below checks for vetting 
 
@@ -75,7 +120,7 @@ class Syllables():
             if isinstance(syllable_item, str):
 
                 # split item string for parsing
-                syllable_subitems = syllable_item.split()
+                syllable_subitems = split_features(syllable_item)
                 
                 # add syllable character to final list
                 # NOTE: consider how turning CV into 'consonant', 'vowel'
@@ -85,22 +130,21 @@ class Syllables():
                 
                 # add a good list of features
                 else:
-                    for syllable_subitem in syllable_subitems:
-                        if not self.phonology.phonetics.has_feature(syllable_subitem):
-                            print(f"Syllables add failed - invalid syllable item {syllable_item}")
-                            return
-                    structure.append(syllable_subitems)
+                    if not all(map(has_feature, syllable_subitems)):
+                        print(f"Syllables add failed - invalid syllable item {syllable_item}")
+                        return
+                    structure.append(list(syllable_subitems))
                 
             # catch and add syllable characters within a one-element list
             elif isinstance(syllable_item, list) and len(syllable_item) == 1 and syllable_item[0] in self.syllable_characters:
-                structure.append(self.syllable_characters[syllable_item[0]])
+                structure.append([self.syllable_characters[syllable_item[0]]])
             # add good list of features directly to new structure
             elif isinstance(syllable_item, list):
                 for feature in syllable_item:
-                    if not self.phonology.phonetics.has_feature(syllable_item):
+                    if not has_feature(feature):
                         print("Phonology add_syllable failed - invalid syllable feature {0}".format(feature))
                         return
-                structure.append(syllable_item)
+                structure.append(list(syllable_item))
         
         return structure
     
@@ -122,6 +166,7 @@ class Syllables():
             syllable_id = f"syllable-{uuid4()}"
             self.syllables[syllable_id] = vetted_structure
             syllable_ids.append(syllable_id)
+        self.changes += 1
 
         # return created syllable ids
         if len(syllable_ids) < 2:
@@ -145,10 +190,12 @@ class Syllables():
         
         # store the updated structure
         self.syllables[syllable_id] = new_structure
+        self.changes += 1
         return syllable_id
 
     def remove(self, syllable_id):
         """Remove one syllable from the syllables map"""
+        self.changes += 1
         return self.syllables.pop(syllable_id, None)
 
     def clear(self):
@@ -157,6 +204,7 @@ class Syllables():
         def read_cache():
             return syllables_cache
         self.syllables.clear()
+        self.changes += 1
         return read_cache
 
     def is_syllable(self, syllable_fragment):
@@ -165,8 +213,9 @@ class Syllables():
             return False
 
         # vet features in syllable fragment
+        ipa_features = self.phonology.phonetics.map_by_ipa()
         features = [
-            set(self.phonology.phonetics.get_features(sound))
+            ipa_features.get(sound, frozenset())
             for sound in syllable_fragment
         ]
         # traverse possible syllables looking for featureset matches
@@ -175,7 +224,7 @@ class Syllables():
                 continue
             # syllable applies to all featureset in features
             matches = [
-                set(features[i]).issuperset(syllable[i])
+                features[i].issuperset(syllable[i])
                 for i in range(len(features))
             ]
             if all(matches):
@@ -194,9 +243,10 @@ class Syllables():
 
     def _vet_sounds(self, sample):
         """Filter a list of known sounds from a sound sample list"""
+        has_ipa = self.phonology.phonetics.has_ipa
         vetted_sounds = [
             sound for sound in sample
-            if self.phonology.phonetics.has_ipa(sound)
+            if has_ipa(sound)
         ]
         return vetted_sounds
 
@@ -220,8 +270,8 @@ class Syllables():
         when another possible syllable follows."""
         
         # Verify sounds list input
-        if not isinstance(sounds, list):
-            raise TypeError(f"Syllables resyllabify expected list of strings not {sounds}")
+        if not isinstance(sounds, (list, tuple)):
+            raise TypeError(f"Syllables resyllabify expected list or tuple of strings not {sounds}")
 
         # Build word with syllables list of lists looking for syllables
         vetted_sample = self._vet_sounds(sounds)
@@ -263,21 +313,21 @@ class Syllables():
         # filter possible syllable options
         possible_syllables = [
             s for i, s in self.syllables.items()
-            if not filter_syllables or i in filter_syllables
-        ]
+            if i in filter_syllables
+        ] if filter_syllables else self.get_structures()
 
         # Syllable Type: choose one syllable
-        syllable = random.choice(possible_syllables)
+        syllable = self.phonology.get_random().choice(possible_syllables)
 
         # Syllable Shape: fill out features for each element in the syllable
         syllable_features = self.phonotactics.shape(syllable)
 
         # Sound Shape: select a sound for each set of features
         syllable_sounds = [
-            random.choice(self.phonology.phonetics.get_ipa(
+            self.phonology.get_random().choice(sorted(self.phonology.phonetics.get_ipa(
                 features,
                 filter_phonemes = self.phonology.inventory()
-            ))
+            )))
             for features in syllable_features
         ]
         
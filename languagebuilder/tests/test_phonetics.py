@@ -51,6 +51,15 @@ class PhoneticsAddUpdateDelete(PhoneticsFixture):
             "failed to add a new symbol and its associated features"
         )
 
+    def test_add_sounds_sharing_features(self):
+        self.phonetics.add("symbol_shared_a", ["feature", "shared"])
+        self.phonetics.add("symbol_shared_b", ["shared", "feature"])
+        self.assertIs(
+            self.phonetics.ipa["symbol_shared_a"],
+            self.phonetics.ipa["symbol_shared_b"],
+            "failed to store one featureset for symbols with identical features"
+        )
+
     def test_update_ipa(self):
         self.phonetics.update_symbol("symbol_update", "symbol_updated")
         self.assertTrue(
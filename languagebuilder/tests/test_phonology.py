@@ -1,39 +1,102 @@
 import unittest
+import pickle
+import os
+import sys
+import subprocess
+import itertools
+import random
+from contextlib import contextmanager
 from ..phonology.phonology import Phonology
 from ..phonetics.phonetics import Phonetics
-from ..tools.flat_list import flatten
+
+# fixture progress messages only printed when requested
+log = print if os.environ.get("PHONOLOGY_TEST_VERBOSE") else lambda *args, **kwargs: None
+
+# pickled base phonology restored for each fixture class
+PHONOLOGY_BLOB = None
+
+# expected sounds for words built from CV syllables
+EXPECT_KA = ("k", "a")
+EXPECT_KAXA = ("k", "a", "x", "a")
+
+# sound samples shared across tests, interned like stored phonetic symbols
+WORD_KHAAGHAGHA = tuple(map(sys.intern, ("kʰ", "a", "a", "gʰ", "a", "gʰ", "a")))
+MORAE_SAMPLE = tuple(map(sys.intern, ("o", "k", "o", "o", "k", "o", "k")))
+MORAE_VOWELS_SAMPLE = tuple(map(sys.intern, ("o", "k", "o", "o", "o", "o", "k", "o", "o", "k", "o", "o")))
+
+# expected structures parsed from syllable strings
+EXPECT_CVV_STRUCTURE = [['consonant'], ['vowel'], ['vowel']]
+EXPECT_V_C_STRUCTURE = [['vowel'], ['_'], ['consonant'], ['#']]
 
 def setUpModule():
-    print("Setting up the Phonology test module")
+    log("Setting up the Phonology test module")
+    # build the base phonology once for all fixture classes
+    global PHONOLOGY_BLOB
+    phonetics = Phonetics()
+    phonetics.add("a", ["vowel", "front", "open", "unrounded"])
+    phonetics.add("k", ["consonant", "voiceless", "velar", "stop"])
+    phonetics.add("g", ["consonant", "voiced", "velar", "stop"])
+    phonetics.add("kʰ", ["consonant", "voiceless", "aspirated", "velar", "stop"])
+    phonetics.add("gʰ", ["consonant", "voiced", "aspirated", "velar", "stop"])
+    phonetics.add("x", ["consonant", "voiceless", "velar", "fricative"])
+    phonetics.add("ɣ", ["consonant", "voiced", "velar", "fricative"])
+    PHONOLOGY_BLOB = pickle.dumps(Phonology(phonetics), pickle.HIGHEST_PROTOCOL)
 
 def tearDownModule():
-    print("Shutting down the Phonology test module")
+    log("Shutting down the Phonology test module")
 
 class PhonologyFixture(unittest.TestCase):
     @classmethod
     def setUpClass(this_class):
-        """Instantiate Phonology for all tests in the class"""
-        print("Setting up a Phonology instance")
-        this_class.phonetics = Phonetics()
-        this_class.phonetics.add("a", ["vowel", "front", "open", "unrounded"])
-        this_class.phonetics.add("k", ["consonant", "voiceless", "velar", "stop"])
-        this_class.phonetics.add("g", ["consonant", "voiced", "velar", "stop"])
-        this_class.phonetics.add("kʰ", ["consonant", "voiceless", "aspirated", "velar", "stop"])
-        this_class.phonetics.add("gʰ", ["consonant", "voiced", "aspirated", "velar", "stop"])
-        this_class.phonetics.add("x", ["consonant", "voiceless", "velar", "fricative"])
-        this_class.phonetics.add("ɣ", ["consonant", "voiced", "velar", "fricative"])
-        this_class.phonology = Phonology(this_class.phonetics)
+        """Instantiate Phonology for all tests in the class. Each class unpickles
+        its own copy, so classes share no mutable state and may run in any
+        order or in separate processes."""
+        log("Setting up a Phonology instance")
+        this_class.phonology = pickle.loads(PHONOLOGY_BLOB)
+        this_class.phonetics = this_class.phonology.phonetics
+        this_class.class_blob = None
+
+    def setUp(self):
+        """Give each test a fresh copy of the class phonology. The snapshot is
+        taken before the first test so it includes sounds and syllables added
+        by subclass setUpClass methods."""
+        this_class = type(self)
+        if this_class.class_blob is None:
+            this_class.class_blob = pickle.dumps(this_class.phonology, pickle.HIGHEST_PROTOCOL)
+        self.phonology = pickle.loads(this_class.class_blob)
+        self.phonetics = self.phonology.phonetics
+
+    @contextmanager
+    def temporary_rules(self, *rules):
+        """Add (source, target, environment) rules for the duration of the block,
+        then restore the rules stored before they were added"""
+        rules_store = self.phonology.rules
+        stored_rules = rules_store.rules.copy()
+        stored_order = rules_store.order[:]
+        try:
+            yield [self.phonology.add_rule(*rule) for rule in rules]
+        finally:
+            rules_store.rules = stored_rules
+            rules_store.order = stored_order
     
     @classmethod
     def tearDownClass(this_class):
         """"Delete Phonology instance for tests"""
-        print("Tearing down a Phonology instance")
+        log("Tearing down a Phonology instance")
         this_class.phonology = None
+        this_class.phonetics = None
+        this_class.class_blob = None
 
 class PhonologyPhonemes(PhonologyFixture):
     @classmethod
     def setUpClass(this_class):
         super(PhonologyPhonemes, this_class).setUpClass()
+        this_class.phonology.add_sounds({
+            "x": ["h"],
+            "k": ["k"],
+            "g": ["g"],
+            "kʰ": ["kh"]
+        })
 
     def test_add_sound(self):
         self.phonology.add_sound("a", ["a"])
@@ -42,16 +105,22 @@ class PhonologyPhonemes(PhonologyFixture):
             "failed to add a new sound to the phonology"
         )
 
+    def test_add_sound_merge_letters(self):
+        self.phonology.add_sound("x", ["kh"], weight=2)
+        self.assertEqual(
+            [self.phonology.get_sound_letters("x"), self.phonology.get_sound_weight("x")],
+            [{"h", "kh"}, 2],
+            "failed to merge letters and weight when adding an existing sound"
+        )
+
     def test_get_sound_features(self):
-        self.phonology.phonemes.add("x", ["h"])
         self.assertEqual(
-            set(self.phonology.get_sound_features("x")),
-            {"consonant", "voiceless", "velar", "fricative"},
+            self.phonology.get_sound_features("x"),
+            frozenset({"consonant", "voiceless", "velar", "fricative"}),
             "failed to add a sound and get its features"
         )
 
     def test_update_sound_letters(self):
-        self.phonology.phonemes.add("k", ["k"])
         self.phonology.phonemes.update("k", ["k", "q"])
         self.assertIn(
             "q",
@@ -60,7 +129,6 @@ class PhonologyPhonemes(PhonologyFixture):
         )
 
     def test_remove_sound(self):
-        self.phonology.phonemes.add("g", ["g"])
         self.phonology.phonemes.remove("g")
         self.assertFalse(
             self.phonology.has_sound("g"),
@@ -76,7 +144,6 @@ class PhonologyPhonemes(PhonologyFixture):
         )
     
     def test_change_sound_extra_feature(self):
-        self.phonology.phonemes.add("kʰ", ["kh"])
         symbol = self.phonology.change_symbol(["voiceless"], ["voiced"], "kʰ")
         self.assertEqual(
             symbol,
@@ -89,6 +156,11 @@ class PhonologySyllables(PhonologyFixture):
     def setUpClass(this_class):
         super(PhonologySyllables, this_class).setUpClass()
 
+    def use_syllables(self, *structures):
+        """Replace the syllables with only these structures"""
+        self.phonology.syllables.clear()
+        self.phonology.syllables.add(*structures)
+
     def test_add_syllable(self):
         syllable_id = self.phonology.syllables.add("CVC")
         self.assertTrue(
@@ -103,12 +175,36 @@ class PhonologySyllables(PhonologyFixture):
             "failed to add a new syllable with phonological features to the phonology"
         )
     
+    def test_add_syllable_with_feature_lists(self):
+        syllable_id = self.phonology.syllables.add([["velar", "stop"], "V"])
+        self.assertEqual(
+            self.phonology.syllables.get(syllable_id),
+            [["velar", "stop"], ["vowel"]],
+            "failed to add a new syllable with lists of phonological features"
+        )
+
+    def test_add_syllable_with_character_lists(self):
+        syllable_id = self.phonology.syllables.add([["C"], ["V"]])
+        self.assertEqual(
+            self.phonology.syllables.get(syllable_id),
+            [["consonant"], ["vowel"]],
+            "failed to add a new syllable with syllable characters wrapped in lists"
+        )
+
+    def test_print_syllables(self):
+        self.use_syllables("CV")
+        self.assertEqual(
+            self.phonology.syllables.print_syllables(),
+            "Syllable 1: consonant, vowel\n",
+            "failed to format syllables as readable text"
+        )
+
     def test_update_syllable(self):
         syllable_id = self.phonology.syllables.add("VVV")
         self.phonology.syllables.update(syllable_id, "CVV")
         self.assertEqual(
             self.phonology.syllables.get(syllable_id),
-            self.phonology.syllables.structure("CVV"),
+            EXPECT_CVV_STRUCTURE,
             "failed to update an existing syllable in the phonology"
         )
 
@@ -116,10 +212,19 @@ class PhonologySyllables(PhonologyFixture):
         structure = self.phonology.syllables.structure("V_C#")
         self.assertEqual(
             structure,
-            [['vowel'], ['_'], ['consonant'], ['#']],
+            EXPECT_V_C_STRUCTURE,
             "failed to parse a string into a structured list of syllable characters"
         )
 
+    def test_parse_syllable_characters_repeatedly(self):
+        structure = self.phonology.syllables.structure("CV")
+        structure[0].append("velar")
+        self.assertEqual(
+            self.phonology.syllables.structure("CV"),
+            [['consonant'], ['vowel']],
+            "failed to reparse a string after changing a previously parsed structure"
+        )
+
     def test_remove_syllable(self):
         syllable_id = self.phonology.syllables.add("CCC")
         self.phonology.syllables.remove(syllable_id)
@@ -128,75 +233,55 @@ class PhonologySyllables(PhonologyFixture):
             "failed to remove an existing syllable from the phonology"
         )
 
-    def test_syllabify_max(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CV")
-        self.phonology.syllables.add("CVV")
-        self.phonology.syllables.add("V")
-        word = ["kʰ", "a", "a", "gʰ", "a", "gʰ", "a"]
-        self.assertEqual(
-            self.phonology.syllables.syllabify(word),
-            [["kʰ", "a", "a"], ["gʰ", "a"], ["gʰ", "a"]],
-            "failed to split a word into maximal syllables"
-        )
-
-    def test_syllabify_min(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CV")
-        self.phonology.syllables.add("CVV")
-        self.phonology.syllables.add("V")
-        word = ["kʰ", "a", "a", "gʰ", "a", "gʰ", "a"]
-        self.assertEqual(
-            self.phonology.syllables.syllabify_min(word),
-            [["kʰ", "a"], ["a"], ["gʰ", "a"], ["gʰ", "a"]],
-            "failed to split a word into minimal syllables"
+    def test_syllabify_cases(self):
+        # case name, syllable structures, syllabify method, sounds, expected syllables
+        syllabify_cases = [
+            ("max", ("CV", "CVV", "V"), 'syllabify',
+                WORD_KHAAGHAGHA,
+                [["kʰ", "a", "a"], ["gʰ", "a"], ["gʰ", "a"]]),
+            ("min", ("CV", "CVV", "V"), 'syllabify_min',
+                WORD_KHAAGHAGHA,
+                [["kʰ", "a"], ["a"], ["gʰ", "a"], ["gʰ", "a"]]),
+            ("invalid word", ("CV", "CVV"), 'syllabify',
+                ["gʰ", "a", "a", "gʰ", "a", "g"],
+                None),
+            ("no leftovers", ("CV", "CVC"), 'syllabify',
+                ["g", "a", "gʰ", "a", "gʰ", "a"],
+                [["g", "a"], ["gʰ", "a"], ["gʰ", "a"]]),
+            ("larger syllable", ("CV", "V", "CVVC"), 'syllabify',
+                ["g", "a", "a", "gʰ"],
+                [["g", "a", "a", "gʰ"]]),
+        ]
+        for name, structures, method, sounds, expected in syllabify_cases:
+            with self.subTest(case=name):
+                self.use_syllables(*structures)
+                self.assertEqual(
+                    getattr(self.phonology.syllables, method)(sounds),
+                    expected,
+                    f"failed to syllabify the {name} case correctly"
+                )
+
+    def test_is_syllabified(self):
+        self.phonology.add_sounds({"g": ["g"], "a": ["a"]})
+        self.assertTrue(
+            self.phonology.suprasegmentals.is_syllabified([["g", "a"], ["a"]]),
+            "failed to recognize a word split into syllables of known sounds"
         )
 
-    def test_syllabify_fail(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CV")
-        self.phonology.syllables.add("CVV")
-        word = ["gʰ", "a", "a", "gʰ", "a", "g"]
-        self.assertIsNone(
-            self.phonology.syllables.syllabify(word),
-            "failed to avoid splitting an invalid word into syllables"
-        )
-    
-    def test_syllabify_leaving_no_leftovers(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CV")
-        self.phonology.syllables.add("CVC")
-        sounds = ["g", "a", "gʰ", "a", "gʰ", "a"]
-        self.assertEqual(
-            self.phonology.syllables.syllabify(sounds),
-            [["g", "a"], ["gʰ", "a"], ["gʰ", "a"]],
-            "failed to split a word into syllables without leaving unsyllabified sounds"
-        )
-    
-    def test_syllabify_choosing_larger_syllable(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CV")
-        self.phonology.syllables.add("V")
-        self.phonology.syllables.add("CVVC")
-        sounds = ["g", "a", "a", "gʰ"]
-        self.assertEqual(
-            self.phonology.syllables.syllabify(sounds),
-            [["g", "a", "a", "gʰ"]],
-            "failed to syllabify a word skipping smaller cuts and opting for one long syllable"
+    def test_is_syllabified_unknown_sound(self):
+        self.phonology.add_sounds({"g": ["g"], "a": ["a"]})
+        self.assertFalse(
+            self.phonology.suprasegmentals.is_syllabified([["g", "a"], ["x", "a"]]),
+            "failed to reject a syllabified word containing a sound missing from the inventory"
         )
     
     def test_syllabify_maintain_length(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CV")
+        self.use_syllables("CV")
         word = []
         for _ in range(3):
             word += self.phonology.syllables.build()
         syllabification = self.phonology.syllables.syllabify(word)
-        flattened_syllabification = [
-            sound
-            for syllable in syllabification
-            for sound in syllable
-        ]
+        flattened_syllabification = list(itertools.chain.from_iterable(syllabification))
         self.assertEqual(
             len(word),
             len(flattened_syllabification),
@@ -204,7 +289,6 @@ class PhonologySyllables(PhonologyFixture):
         )
 
     def test_count_syllables_simple(self):
-        self.phonology.syllables.clear
         self.phonology.syllables.add("CV")
         word = ["kʰ", "a", "gʰ", "a", "gʰ", "a"]
         self.assertEqual(
@@ -214,7 +298,6 @@ class PhonologySyllables(PhonologyFixture):
         )
     
     def test_count_syllables_complex(self):
-        self.phonology.syllables.clear
         self.phonology.syllables.add("CV")
         self.phonology.syllables.add("CCV")
         self.phonology.syllables.add("CCVV")
@@ -229,7 +312,6 @@ class PhonologySyllables(PhonologyFixture):
 
     # TODO: optional syllable values like (C)CV(C)
     def test_syllable_clusters(self):
-        self.phonology.syllables.clear
         self.phonology.syllables.add("CCVC")
         self.phonology.syllables.add("CVC")
         self.phonology.syllables.add("CV")
@@ -244,7 +326,6 @@ class PhonologySyllables(PhonologyFixture):
 
     # TODO: syllable diphthongs
     def test_syllable_diphthongs(self):
-        self.phonology.syllables.clear
         self.phonology.syllables.add("CV")
         word = ["k", "a", "i"]
         self.assertEqual(
@@ -254,8 +335,7 @@ class PhonologySyllables(PhonologyFixture):
         )
     
     def test_syllable_optional_consonants(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("(C)CV(C)")
+        self.use_syllables("(C)CV(C)")
         syllables = [
             ["k", "x", "a", "x"],
             ["k", "x", "a"],
@@ -273,7 +353,6 @@ class PhonologySyllables(PhonologyFixture):
 
     # TODO: syllable sonority that allows for violations
     def test_syllable_sonority(self):
-        self.phonology.syllables.clear
         self.phonology.syllables.add("CCV")
         word_a = ["x", "k", "a"]   # matches sonority
         word_b = ["k", "x" "a"]    # violates sonority
@@ -305,14 +384,13 @@ class PhonologySyllables(PhonologyFixture):
     #     )
 
     def test_syllable_build_simple_with_sonority(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CCV")
+        self.use_syllables("CCV")
         self.phonology.syllables.add_sonority("vowel")
         self.phonology.syllables.add_sonority("fricative")
         self.phonology.syllables.add_sonority("stop")
         syllable = self.phonology.syllables.build()
         syllable_features = [
-            set(self.phonology.phonetics.get_features(sound))
+            self.phonetics.map_by_ipa()[sound]
             for sound in syllable
         ]
         sonority = [{"stop"}, {"fricative"}, {"vowel"}]
@@ -331,8 +409,7 @@ class PhonologySyllables(PhonologyFixture):
         self.phonetics.add("n", ["consonant", "voiced", "nasal", "alveolar"])
         self.phonetics.add("j", ["consonant", "voiced", "palatal", "approximant"])
         # set up complex syllables
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CCCCV")
+        self.use_syllables("CCCCV")
         self.phonology.syllables.add_sonority("vowel")
         self.phonology.syllables.add_sonority("approximant")
         self.phonology.syllables.add_sonority("nasal")
@@ -341,7 +418,7 @@ class PhonologySyllables(PhonologyFixture):
         self.phonology.syllables.add_sonority("stop")
         syllable = self.phonology.syllables.build()
         syllable_features = [
-            set(self.phonology.phonetics.get_features(sound))
+            self.phonetics.map_by_ipa()[sound]
             for sound in syllable
         ]
         sonority = [{"stop"}, {"fricative"}, {"nasal"}, {"approximant"}, {"vowel"}]
@@ -361,15 +438,14 @@ class PhonologySyllables(PhonologyFixture):
         )
 
     def test_syllable_overflowing_and_missing_sonority(self):
-        self.phonology.syllables.clear()
-        self.phonology.syllables.add("CCCVCCC")
+        self.use_syllables("CCCVCCC")
         self.phonology.syllables.add_sonority("vowel")
         self.phonology.syllables.add_sonority("fricative")
         self.phonology.syllables.add_sonority("affricate")
         self.phonology.syllables.add_sonority("stop")
         syllable = self.phonology.syllables.build(use_sonority=True)
         syllable_features = [
-            set(self.phonology.phonetics.get_features(sound))
+            self.phonetics.map_by_ipa()[sound]
             for sound in syllable
         ]
         sonority = [{"stop"}, {"stop"}, {"fricative"}, {"vowel"}, {"fricative"}, {"stop"}, {"stop"}]
@@ -386,23 +462,20 @@ class PhonologySyllables(PhonologyFixture):
 
 # TODO: test 
 #   - epenthesis, anaptyxis: fl > ifl- vs fil-, or .spjV. > es.pjV
-class SyllablePhonotactics(unittest.TestCase):
+class SyllablePhonotactics(PhonologyFixture):
     @classmethod
     def setUpClass(this_class):
-        #super(SyllablePhonotactics, this_class).setUpClass()
-        this_class.phonetics = Phonetics()
-        this_class.phonetics.add("a", ["vowel", "front", "open", "unrounded"])
-        this_class.phonetics.add("k", ["consonant", "voiceless", "velar", "stop"])
-        this_class.phonetics.add("x", ["consonant", "voiceless", "velar", "fricative"])
+        super(SyllablePhonotactics, this_class).setUpClass()
         this_class.phonetics.add("s", ["consonant", "voiceless", "alveolar", "sibilant"])
         this_class.phonetics.add("l", ["consonant", "voiced", "alveolar", "lateral"])
         this_class.phonetics.add("j", ["consonant", "voiced", "palatal", "approximant", "glide"])
         this_class.phonetics.add("n", ["consonant", "voiced", "alveolar", "nasal"])
-        this_class.phonology = Phonology(this_class.phonetics)
-        this_class.phonology.phonemes.add("s", ["s"])
-        this_class.phonology.phonemes.add("l", ["l"])
-        this_class.phonology.phonemes.add("j", ["j"])
-        this_class.phonology.phonemes.add("n", ["n"])
+        this_class.phonology.add_sounds({
+            "s": ["s"],
+            "l": ["l"],
+            "j": ["j"],
+            "n": ["n"]
+        })
     
     # TODO: vet features for add
     def test_add_nucleus(self):
@@ -491,10 +564,12 @@ class PhonologySyllableShape(PhonologyFixture):
         this_class.phonetics.add("l", ["consonant", "voiced", "alveolar", "lateral"])
         this_class.phonetics.add("j", ["consonant", "voiced", "palatal", "approximant"])
         this_class.phonetics.add("n", ["consonant", "voiced", "alveolar", "nasal"])
-        this_class.phonology.phonemes.add("s", ["s"])
-        this_class.phonology.phonemes.add("l", ["l"])
-        this_class.phonology.phonemes.add("j", ["j"])
-        this_class.phonology.phonemes.add("n", ["n"])
+        this_class.phonology.add_sounds({
+            "s": ["s"],
+            "l": ["l"],
+            "j": ["j"],
+            "n": ["n"]
+        })
         this_class.phonology.syllables.add("CCCCVCCC")
 
     # TODO: role to ensure believability in distribution of number of consonants CCCCVCCC
@@ -553,8 +628,10 @@ class PhonologyWords(PhonologyFixture):
     @classmethod
     def setUpClass(this_class):
         super(PhonologyWords, this_class).setUpClass()
-        this_class.phonology.phonemes.add("k", ["q"])
-        this_class.phonology.phonemes.add("a", ["a"])
+        this_class.phonology.add_sounds({
+            "k": ["q"],
+            "a": ["a"]
+        })
         this_class.phonology.syllables.add("CV")
 
     def test_build_word_sounds(self):
@@ -573,6 +650,66 @@ class PhonologyWords(PhonologyFixture):
             "failed to build a word with simple spelling"
         )
 
+    def test_build_words(self):
+        entries = self.phonology.build_words(3, length=2, as_string=True)
+        self.assertEqual(
+            [entry['sound'] for entry in entries],
+            ["kaka", "kaka", "kaka"],
+            "failed to build a batch of two-syllable words"
+        )
+
+    def test_build_word_weights(self):
+        unweighted = self.phonology.get_inventory_weights(["consonant"])
+        self.phonology.update_sound("k", weight=3)
+        self.assertEqual(
+            [unweighted, self.phonology.get_inventory_weights(["consonant"])],
+            [[1], [3]],
+            "failed to read updated sound weights for choosing word sounds"
+        )
+
+    def test_build_word_prefers_heavier_sounds(self):
+        self.phonology.update_sound("k", weight=9)
+        self.phonology.add_sound("x", ["h"], weight=1)
+        self.phonology.rng = random.Random(5)
+        consonants = [
+            entry['sound'][0]
+            for entry in self.phonology.build_words(200)
+        ]
+        self.assertGreater(
+            consonants.count("k"),
+            3 * consonants.count("x"),
+            "failed to choose heavier sounds more often when building words"
+        )
+
+    def test_build_word_seeded_rng(self):
+        # same seed builds the same words in another process with other set ordering
+        self.phonology.add_sounds({"g": ["g", "gh"], "x": ["x", "h", "kh"]})
+        phonology_blob = pickle.dumps(self.phonology, pickle.HIGHEST_PROTOCOL)
+        build_script = "; ".join((
+            "import pickle, random, sys",
+            "phonology = pickle.loads(sys.stdin.buffer.read())",
+            "phonology.rng = random.Random(3)",
+            "print([w['spelling'] for w in phonology.build_words(5, length=3, as_string=True)])"
+        ))
+        subprocess_words = subprocess.check_output(
+            [sys.executable, "-c", build_script],
+            input=phonology_blob,
+            env=dict(
+                os.environ,
+                PYTHONPATH=os.pathsep.join(sys.path),
+                PYTHONHASHSEED="2" if os.environ.get("PYTHONHASHSEED") == "1" else "1",
+                PYTHONIOENCODING="utf-8"
+            )
+        ).decode("utf-8").strip()
+        phonology = pickle.loads(phonology_blob)
+        phonology.rng = random.Random(3)
+        built_words = [w['spelling'] for w in phonology.build_words(5, length=3, as_string=True)]
+        self.assertEqual(
+            subprocess_words,
+            str(built_words),
+            "failed to build the same words from the same seeded rng"
+        )
+
     def test_add_rule(self):
         rule_id = self.phonology.add_rule(['vowel'], ['vowel'], "_")
         self.assertTrue(
@@ -596,67 +733,28 @@ class PhonologyWords(PhonologyFixture):
             "failed to build a simple three syllable word"
         )
 
-    def test_build_word_fricativization(self):
-        rule_id = self.phonology.add_rule(["stop"], ["fricative"], "V_V")
-        entry = self.phonology.build_word(2)
-        self.phonology.remove_rule(rule_id)
-        self.assertEqual(
-            entry['change'],
-            list("kaxa"),
-            "failed to apply a single stop-to-fricative rule correctly"
-        )
-
-    def test_build_word_voicing(self):
-        rule_id = self.phonology.add_rule(["voiceless"], ["voiced"], "V_V")
-        entry = self.phonology.build_word(2, as_string=True)
-        self.phonology.remove_rule(rule_id)
-        self.assertEqual(
-            entry['change'],
-            "kaga",
-            "failed to apply a single voicing rule correctly"
-        )
-
-    def test_build_word_lenition(self):
-        rule_0 = self.phonology.add_rule(["stop"], ["fricative"], "V_V")
-        rule_1 = self.phonology.add_rule(["voiceless"], ["voiced"], "V_V")
-        entry = self.phonology.build_word(2, as_string=True)
-        self.phonology.remove_rule(rule_0)
-        self.phonology.remove_rule(rule_1)
-        self.assertEqual(
-            entry['change'],
-            "kaɣa",
-            "failed to layer multiple leniting rules correctly"
-        )
-    
-    def test_build_word_inapplicable_rule(self):
-        rule_id = self.phonology.add_rule(["dental"], ["velar"], "_V")
-        entry = self.phonology.build_word(1)
-        self.phonology.remove_rule(rule_id)
-        self.assertEqual(
-            entry['sound'],
-            list("ka"),
-            "applied rule to inapplicable sound"
-        )
-
-    def test_build_word_applicable_rule_nonexisting_sound(self):
-        rule_id = self.phonology.add_rule(["velar"], ["palatal"], "_")
-        entry = self.phonology.build_word(1, as_string=True)
-        self.phonology.remove_rule(rule_id)
-        self.assertEqual(
-            entry['sound'],
-            "ka",
-            "failed to handle sound change where changed feature combination does not exist in the phonetics"
-        )
-    
-    def test_build_word_nochange_rule(self):
-        rule_id = self.phonology.add_rule(["velar"], ["velar"], "_V")
-        entry = self.phonology.build_word(1, as_string=True)
-        self.phonology.remove_rule(rule_id)
-        self.assertEqual(
-            entry['sound'],
-            "ka",
-            "applied rule to inapplicable sound"
-        )    
+    def test_build_word_rules(self):
+        # case name, rules to apply, word length, entry key, expected sounds
+        rule_cases = [
+            ("fricativization", [(["stop"], ["fricative"], "V_V")], 2, 'change', EXPECT_KAXA),
+            ("voicing", [(["voiceless"], ["voiced"], "V_V")], 2, 'change', tuple("kaga")),
+            ("lenition", [
+                (["stop"], ["fricative"], "V_V"),
+                (["voiceless"], ["voiced"], "V_V")
+            ], 2, 'change', tuple("kaɣa")),
+            ("inapplicable rule", [(["dental"], ["velar"], "_V")], 1, 'sound', EXPECT_KA),
+            ("applicable rule nonexisting sound", [(["velar"], ["palatal"], "_")], 1, 'sound', EXPECT_KA),
+            ("nochange rule", [(["velar"], ["velar"], "_V")], 1, 'sound', EXPECT_KA),
+        ]
+        for name, rules, length, key, expected in rule_cases:
+            with self.subTest(case=name):
+                with self.temporary_rules(*rules):
+                    entry = self.phonology.build_word(length)
+                self.assertEqual(
+                    tuple(entry[key]),
+                    expected,
+                    f"failed to build word applying {name} rules correctly"
+                )
 
 class PhonologySpelling(PhonologyFixture):
     @classmethod
@@ -665,18 +763,24 @@ class PhonologySpelling(PhonologyFixture):
         this_class.phonetics.add("ts", ["consonant", "voiceless", "alveolar", "affricate"])
         this_class.phonetics.add("dz", ["consonant", "voiced", "alveolar", "affricate"])
         this_class.phonetics.add("o", ["vowel", "back", "mid", "rounded"])
-        this_class.phonology.phonemes.add("ts", ["c"])
-        this_class.phonology.phonemes.add("dz", ["z"])
-        this_class.phonology.phonemes.add("o", ["o"])
+        this_class.phonology.add_sounds({
+            "ts": ["c"],
+            "dz": ["z"],
+            "o": ["o"]
+        })
         this_class.phonology.syllables.add("CV")
+
+    def assertJoinedEqual(self, parts, expected, msg=None):
+        """Assert that a list of letters or sounds (or None) spells out the expected string"""
+        self.assertEqual("".join(parts or ()), expected, msg)
         
     def test_spell_word(self):
         # spell the word as given in letters
         phonemes = ['ts', 'o', 'ts', 'o']
         # use class phonology to spell word
         spelling = self.phonology.spell(phonemes)
-        self.assertEqual(
-            "".join(spelling),
+        self.assertJoinedEqual(
+            spelling,
             "coco",
             "failed to spell a simple word with known letters"
         )
@@ -687,21 +791,21 @@ class PhonologySpelling(PhonologyFixture):
         fallback_phonemes = ['ts', 'o', 'ts', 'o']
         # use class phonology to spell
         spelling = self.phonology.spell(phonemes, fallback_phonemes)
-        self.assertEqual(
-            "".join(spelling),
+        self.assertJoinedEqual(
+            spelling,
             "cozo",
             "failed to use fallback phonemes correctly when spelling a word"
         )
 
     def test_spell_word_sound_change(self):
-        self.phonology.add_rule("voiceless", "voiced", "V_")
         # spell changed sounds but fall back on pre-change sounds
         phonemes = ['ts', 'o', 'ts', 'o']
-        changed_phonemes = self.phonology.apply_rules(phonemes)
+        with self.temporary_rules(("voiceless", "voiced", "V_")):
+            changed_phonemes = self.phonology.apply_rules(phonemes)
         # use class phonology to spell
         spelling = self.phonology.spell(changed_phonemes, phonemes)
-        self.assertEqual(
-            "".join(spelling) if spelling else "",
+        self.assertJoinedEqual(
+            spelling,
             "cozo",
             f"failed to spell a word after a sound change was applied"
         )
@@ -713,171 +817,40 @@ class PhonologySpelling(PhonologyFixture):
         # TODO: extract rule from difference (like dz > ts picking up on voicing)
 
         # add sound change and build word 
-        self.phonology.add_rule("voiceless", "voiced", "V_")
-        word = self.phonology.build_word(
-            length=4,
-            apply_rules=True,
-            spell_after_change=True,
-            as_string=True
-        )
+        with self.temporary_rules(("voiceless", "voiced", "V_")):
+            word = self.phonology.build_word(
+                length=4,
+                apply_rules=True,
+                spell_after_change=True,
+                as_string=True
+            )
         # expect word
         self.assertIn(
-            (None, word['spelling'])[not not word['spelling']],
+            word['spelling'] or None,
             ["cozozozo", "zozozozo"],  # changes result in ts,dz > dz | V_(V)
             "failed to generate a word with valid spelling"
         )
 
-class PhonologySuprasegmentals(PhonologyFixture):
-    @classmethod
-    def setUpClass(this_class):
-        super(PhonologySuprasegmentals, this_class).setUpClass()
-        this_class.phonetics.add("ts", ["consonant", "voiceless", "alveolar", "affricate"])
-        this_class.phonetics.add("o", ["vowel", "back", "mid", "rounded"])
-        this_class.phonology.phonemes.add("ts", ["c"])
-        this_class.phonology.phonemes.add("o", ["o"])
-        this_class.phonology.syllables.add("CV")
-        this_class.phonology.syllables.add("V")
-        #this_class.phonology.suprasegmentals.add("`", stress="primary", pitch=None)
-
-    # # TODO: rewrite suprasegmentals tests below considering:
-    # #   - custom contours
-    # #   - default contours
-    # #   - ability to mark both sound and spelling
-    # #   - ability to mark any letters of interest (not only V)
-    # #   - /!\ syllable shape checks
-    # #       - accent last if long [C,V,C,(C)] otherwise penult
-    # #       - high tone on second mora no matter which syllable
-
-    # def test_add_remove_default_contour(self):
-    #     contour_name = self.phonology.suprasegmentals.add_default_contour(
-    #         "primary",
-    #         mark="`",
-    #         conditioning_mark=None,
-    #         offset=1,
-    #         chain=None
-    #     )
-    #     contour = self.phonology.suprasegmentals.get_default_contour(contour_name)
-    #     self.phonology.suprasegmentals.remove_default_contour(contour_name)
-    #     self.assertEqual(
-    #         contour.get('offset'),
-    #         1,
-    #         f"failed to create, store and remove a suprasegmentals default contour"
-    #     )
-
-    # def test_apply_default_contour(self):
-    #     self.phonology.suprasegmentals.add_default_contour("default_accent", "acute", offset=-1)
-    #     accented_word = self.phonology.suprasegmentals.apply_default_contour([["r", "p", "a"], ["b", "a"], ["p", "a", "p"]], "default_accent")
-    #     # TODO: add mark -> letter mapping
-    #     self.assertEqual(
-    #         "".join(flatten(accented_word)),
-    #         "rpabapáp",
-    #         "failed to apply a suprasegmentals default contour"
-    #     )
-    
-    # def test_mark_accent(self):
-    #     word = self.phonology.build_word(
-    #         length=3,
-    #         apply_rules=True,
-    #         spell_after_change=False
-    #     )
-    #     # NOTE: or store marking info in built word?
-    #     word = self.phonology.suprasegmentals.mark(word['sound'], 2, stress="primary")
-    #     self.assertEqual(
-    #         word,
-    #         "tsotsòtso",
-    #         "failed to mark a generated word with an accent"
-    #     )
-
-    # def test_move_accent(self):
-    #     word = self.phonology.build_word(length=4, apply_rules=True)
-    #     # NOTE: mark name still needed to retrieve which mark to adjust
-    #     # TODO: how to represent word-wide pitch contours
-    #     self.phonology.suprasegmentals.mark(word['sound'], 3, stress="primary")
-    #     word = self.phonology.suprasegmentals.move(word['sound'], 4, stress="primary")
-    #     self.assertEqual(
-    #         word,
-    #         "tsotsotsòtso",
-    #         "failed to move a generated word's accent to a new syllable"
-    #     )
-
-    # # TODO: attach marks to syllable, persist marks through sound changes,
-    # # update marks with mark changes, have marks associated with spelling
-    # # Sound changes:
-    # #   - what if a marked sound is deleted in a change?
-    # #   - what if a marked sound falls after a deleted sound?
-    # #   - what if a sound change depends on e.g. a previous accent shift?
-    # #   - what if a change impacts both underlying sound and added mark?
-    # # Spelling:
-    # #   - how to spell vs ignore marked sounds?
-    # #   - when does spelling take place?
-    # #   - how are spelled letters marked? independently of marked sounds?
-
-    # def test_accent_sound_and_spelling(self):
-        
-    #     # word = self.phonology.build_word(length=4, apply_rules=True)
-    #     # imagine a fixed word
-    #     word_sounds = "bopo'bipo"   # expected segs output
-        
-    #     # accomodate two changes: oxytonic stress, high V syncope C_C
-    #     word_change = self.phonology.apply_rules(word_sounds)  # expect "bopop'po"
-        
-    #     # ensure markings are stored for seg accentuation
-    #     # phon_char = "'"
-    #     # spelled_char = "´" # also map to specific letters: á, ŕ, ...
-
-    #     # now based on those changes the following words should be renderable
-    #     # in post-change sounds and spelling form
-    #     spelled_sounds = self.phonology.suprasegmentals.sound_out(word_change)
-    #     spelled_change = self.phonology.suprasegmentals.spell_out(word_change)
-    #     self.assertEqual(
-    #         [spelled_sounds, spelled_change],
-    #         ["bopobípo", "bopopó"],
-    #         "failed to change accented phonological segments and spell the changed sounds"
-    #     )
-
-    # def test_accent_default(self):
-    #     self.phonology.suprasegmentals.default(
-    #         stress="primary",
-    #         syllable=-2
-    #     )
-    #     word = [["t", "o"], ["t", "a"], ["t", "o"]]
-    #     spelling = self.phonology.suprasegmentals.spell_out(word)
-    #     self.assertEqual(
-    #         spelling,
-    #         "totáto",
-    #         "failed to apply default accentuation to segments and spell the accented word"
-    #     )
-
-    # def test_accent_exception(self):
-    #     self.phonology.suprasegmentals.default(
-    #         stress="primary",
-    #         syllable=-2,
-    #         mark_exception=True
-    #     )
-    #     word = [["t", "o"], ["t", "a"], ["t", "o"]]
-    #     marked_word = self.phonology.suprasegmentals.mark((word, 0), 3, stress="primary")
-    #     unmarked_word = self.phonology.suprasegmentals.mark((word, 1), 2, stress="primary")
-    #     marked_spelling = self.phonology.suprasegmentals.spell_out((word, 0))
-    #     unmarked_spelling = self.phonology.suprasegmentals.spell_out((word, 1))
-    #     self.assertEqual(
-    #         [marked_spelling, unmarked_spelling],
-    #         ["totató", "totato"],
-    #         "failed to mark exception to default accentuation while leaving nonexception unmarked"
-    #     )
-
 class PhonologyMorae(PhonologyFixture):
     @classmethod
     def setUpClass(this_class):
         super(PhonologyMorae, this_class).setUpClass()
         this_class.phonetics.add("k", ["consonant", "voiceless", "velar", "stop"])
         this_class.phonetics.add("o", ["vowel", "back", "mid", "rounded"])
-        this_class.phonology.phonemes.add("k", ["c"])
-        this_class.phonology.phonemes.add("o", ["o"])
-        this_class.phonology.syllables.add("VC")
-        this_class.phonology.syllables.add("VVC")
+        this_class.phonology.add_sounds({
+            "k": ["c"],
+            "o": ["o"]
+        })
+        this_class.phonology.syllables.add("VC", "VVC")
+        this_class.phonology.morae.add_many([
+            (["V", "C"], 1),
+            (["V", "V", "C"], 2),
+            (["vowel"], 1),
+            ([["back", "vowel"], "V", "C"], 3)
+        ])
     
     def test_add_basic_mora(self):
-        moraic_id = self.phonology.morae.add([["vowel"], ["consonant"]], beats=1)
+        moraic_id = self.phonology.morae.add([["consonant"], ["vowel"]], beats=1)
         self.assertIn(
             moraic_id,
             self.phonology.morae.get(),
@@ -893,14 +866,23 @@ class PhonologyMorae(PhonologyFixture):
         )
 
     def test_check_mora(self):
-        moraic_id = self.phonology.morae.add(["V", "V", "C"], beats=2, overwrite=True)
-        self.assertTrue(
-            self.phonology.morae.get(moraic_id),
-            "failed to find known mora id in stored morae"
+        moraic_id = self.phonology.morae.add(["V", "V", "C"], beats=3, overwrite=True)
+        self.assertEqual(
+            self.phonology.morae.get(moraic_id)['beats'],
+            3,
+            "failed to overwrite a known mora with a new beat count"
+        )
+
+    def test_add_existing_mora(self):
+        moraic_id = self.phonology.morae.add(["V", "V", "C"], beats=3)
+        existing_moraic_id = self.phonology.morae.find(["V", "V", "C"])[0]
+        self.assertEqual(
+            [moraic_id, self.phonology.morae.get(existing_moraic_id)['beats']],
+            [None, 2],
+            "failed to keep the beat count of a known mora added without overwrite"
         )
 
     def test_find_mora(self):
-        self.phonology.morae.add(["V", "V", "C"], beats=2, overwrite=True)
         self.assertTrue(
             self.phonology.morae.find(["vowel", "vowel", "consonant"]),
             "failed to find known mora when searching morae"
@@ -914,14 +896,14 @@ class PhonologyMorae(PhonologyFixture):
         )
     
     def test_find_by_beatcount(self):
-        moraic_id = self.phonology.morae.add([["back", "vowel"], "V", "C"], beats=3, overwrite=True)
+        moraic_id = self.phonology.morae.find([["back", "vowel"], "V", "C"])[0]
         self.assertIn(
             moraic_id,
             self.phonology.morae.find(beats=3),
             "failed to find existing valid moraic entry by its beatcount"
         )
     def test_find_by_structure(self):
-        moraic_id = self.phonology.morae.add(["V", "V", "C"], beats=3, overwrite=True)
+        moraic_id = self.phonology.morae.find(beats=2)[0]
         self.assertIn(
             moraic_id,
             self.phonology.morae.find(mora=["V", "V", "C"]),
@@ -929,20 +911,15 @@ class PhonologyMorae(PhonologyFixture):
         )
 
     def test_count_morae(self):
-        self.phonology.morae.add(["V", "C"], beats=1, overwrite=True)
-        self.phonology.morae.add(["V", "V", "C"], beats=2, overwrite=True)
-        sample = ['o', 'k', 'o', 'o', 'k', 'o', 'k']
         self.assertEqual(
-            self.phonology.morae.count(sample),
+            self.phonology.morae.count(MORAE_SAMPLE),
             4,
             "failed to return the correct count of morae in a sound sample"
         )
 
     def test_count_underextended_morae(self):
-        self.phonology.morae.add(["vowel"], beats=1, overwrite=True)
-        sample = ['o', 'k', 'o', 'o', 'o', 'o', 'k', 'o', 'o', 'k', 'o', 'o']
         self.assertEqual(
-            self.phonology.morae.count(sample),
+            self.phonology.morae.count(MORAE_VOWELS_SAMPLE),
             9,
             "failed to count sample morae while considering vowels and discounting consonants"
         )
@@ -1,4 +1,5 @@
 from collections import deque
+from itertools import chain
 
 def flatten(l, depth=None, map_expression=None, filter_expression=None):
     """"Take a nested sequence and return a flattened list with no subcollections.
@@ -19,12 +20,11 @@ def flatten(l, depth=None, map_expression=None, filter_expression=None):
         depth -= 1
 
     # reached another list - flatten it
-    flat_l = []
-    # recurse through sublists
-    for l_sub in l:
-        flat_l += flatten(l_sub, depth, map_expression=map_expression, filter_expression=filter_expression)
-
-    return flat_l
+    # recurse through sublists chaining their flattened elements
+    return list(chain.from_iterable(
+        flatten(l_sub, depth, map_expression=map_expression, filter_expression=filter_expression)
+        for l_sub in l
+    ))
 
 # NOTE: current use treats dict as a terminal object
 def is_primitive(l):